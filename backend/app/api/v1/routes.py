@@ -1,13 +1,29 @@
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any, DefaultDict, Tuple
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse, Response
+from typing import List, Dict, Any, DefaultDict, Tuple, Optional
 from collections import defaultdict
 import re
 
 from app.schemas.review import ReviewCreate, ReviewResponse
 from app.services import scraper, analysis
 
+# orjson encodes large review lists much faster than the stdlib encoder (optional)
+try:
+    import orjson
+    _has_orjson = True
+except Exception:
+    _has_orjson = False
+
+def _json_response(content: Dict[str, Any]) -> Response:
+    if _has_orjson:
+        return Response(content=orjson.dumps(content), media_type="application/json")
+    return JSONResponse(content=content)
+
 router = APIRouter()
 
+# fields a client may request via ?fields=review_text,sentiment,...
+REVIEW_FIELDS = ("review_text", "sentiment", "score", "aspects", "aspect_sentiments", "sentences")
+
 # Simple aspect keywords mapping for MVP (tweak/add keywords per category)
 ASPECT_KEYWORDS: Dict[str, List[str]] = {
     "battery": ["battery", "battery life", "charge", "charging"],
@@ -33,6 +49,30 @@ def extract_aspects(text: str) -> List[str]:
     # return unique aspect list
     return list(dict.fromkeys(found))
 
+# Per-aspect label and mean score from the sentences that mention the aspect.
+# Aspects no sentence mentions (e.g. "general") get the fallback label and no score.
+def aspect_sentiments(sentences: List[Dict[str, Any]], aspects: List[str], fallback: str) -> Tuple[Dict[str, str], Dict[str, float]]:
+    sentence_aspects = [set(extract_aspects(s.get("text", ""))) for s in sentences]
+    labels: Dict[str, str] = {}
+    scores: Dict[str, float] = {}
+    for aspect in aspects:
+        matched = [s for s, found in zip(sentences, sentence_aspects) if aspect in found]
+        if not matched:
+            labels[aspect] = fallback
+            continue
+        pos = sum(1 for s in matched if str(s.get("label", "")).upper().startswith("POS"))
+        neg = sum(1 for s in matched if str(s.get("label", "")).upper().startswith("NEG"))
+        if pos > neg:
+            labels[aspect] = "POSITIVE"
+        elif neg > pos:
+            labels[aspect] = "NEGATIVE"
+        else:
+            labels[aspect] = "NEUTRAL"
+        matched_scores = [float(s["score"]) for s in matched if s.get("score") is not None]
+        if matched_scores:
+            scores[aspect] = sum(matched_scores) / len(matched_scores)
+    return labels, scores
+
 # Heuristic to decide whether a text chunk looks like a user review
 def is_likely_review(text: str) -> bool:
     if not text:
@@ -55,9 +95,30 @@ def is_likely_review(text: str) -> bool:
         return True
     return False
 
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if not fields:
+        return None
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in REVIEW_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown review field(s): {', '.join(unknown)}. Allowed: {', '.join(REVIEW_FIELDS)}."
+        )
+    return list(dict.fromkeys(requested))
+
 @router.post("/reviews/", response_model=ReviewResponse)
-async def analyze_review(review: ReviewCreate):
+async def analyze_review(
+    review: ReviewCreate,
+    summary_only: bool = Query(False, description="Return only summary, aspect_summary and recommendation."),
+    offset: Optional[int] = Query(None, ge=0, description="Index of the first review to return (default: 0)."),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of reviews to return (default: all)."),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of review fields to return, e.g. 'sentiment,score'."),
+    sentence_level: bool = Query(False, description="Split reviews into sentences, score them and add per-sentence and per-aspect sentiment."),
+):
     try:
+        projection = parse_fields(fields)
+
         scraped_reviews: List[str] = scraper.scrape_reviews(review.url) or []
         filtered_reviews = [r for r in scraped_reviews if is_likely_review(r)]
 
@@ -67,9 +128,11 @@ async def analyze_review(review: ReviewCreate):
                 detail="No reviews detected on the provided URL. Make sure you supplied a product/reviews page (not a homepage or listing)."
             )
 
-        raw_results: List[Dict[str, Any]] = analysis.analyze_sentiment(filtered_reviews)
+        raw_results: List[Dict[str, Any]] = analysis.analyze_sentiment(filtered_reviews, chunk_sentences=sentence_level)
 
         reviews_out: List[Dict[str, Any]] = []
+        # per-review {aspect: mean sentence score}, parallel to reviews_out (sentence_level only)
+        aspect_scores_out: List[Dict[str, float]] = []
         for i, text in enumerate(filtered_reviews):
             res = raw_results[i] if i < len(raw_results) else None
             label = "NEUTRAL"
@@ -93,12 +156,18 @@ async def analyze_review(review: ReviewCreate):
             if not aspects:
                 aspects = ["general"]
 
-            reviews_out.append({
+            review_out: Dict[str, Any] = {
                 "review_text": text,
                 "sentiment": label,
                 "score": score,
                 "aspects": aspects
-            })
+            }
+            a_scores: Dict[str, float] = {}
+            if isinstance(res, dict) and res.get("sentences") is not None:
+                review_out["sentences"] = res["sentences"]
+                review_out["aspect_sentiments"], a_scores = aspect_sentiments(res["sentences"], aspects, label)
+            reviews_out.append(review_out)
+            aspect_scores_out.append(a_scores)
 
         total = len(reviews_out)
         pos = sum(1 for r in reviews_out if r["sentiment"].startswith("POS"))
@@ -108,18 +177,21 @@ async def analyze_review(review: ReviewCreate):
 
         # per-aspect aggregation
         aspect_stats: DefaultDict[str, Dict[str, Any]] = defaultdict(lambda: {"total": 0, "positive": 0, "negative": 0, "neutral": 0, "score_sum": 0.0, "score_count": 0})
-        for r in reviews_out:
+        for r, per_aspect_score in zip(reviews_out, aspect_scores_out):
+            per_aspect = r.get("aspect_sentiments") or {}
             for a in r["aspects"]:
                 st = aspect_stats[a]
                 st["total"] += 1
-                if r["sentiment"].startswith("POS"):
+                a_label = per_aspect.get(a, r["sentiment"])
+                if a_label.startswith("POS"):
                     st["positive"] += 1
-                elif r["sentiment"].startswith("NEG"):
+                elif a_label.startswith("NEG"):
                     st["negative"] += 1
                 else:
                     st["neutral"] += 1
-                if r.get("score") is not None:
-                    st["score_sum"] += float(r["score"])
+                a_score = per_aspect_score.get(a, r.get("score"))
+                if a_score is not None:
+                    st["score_sum"] += float(a_score)
                     st["score_count"] += 1
 
         aspect_summary: Dict[str, Dict[str, Any]] = {}
@@ -204,7 +276,25 @@ async def analyze_review(review: ReviewCreate):
             "average_sentiment": avg
         }
 
-        return ReviewResponse(reviews=reviews_out, summary=summary, aspect_summary=aspect_summary, recommendation=recommendation)
+        # ---------- Response shaping ----------
+        # Built as plain dicts and returned as a Response so FastAPI skips
+        # re-validating thousands of reviews against ReviewResponse.
+        content: Dict[str, Any] = {
+            "summary": summary,
+            "aspect_summary": aspect_summary,
+            "recommendation": recommendation
+        }
+        if not summary_only:
+            start = offset or 0
+            page_reviews = reviews_out[start:start + limit] if limit is not None else reviews_out[start:]
+            if projection is not None:
+                # keys a review doesn't carry stay omitted rather than null
+                page_reviews = [{f: r[f] for f in projection if f in r} for r in page_reviews]
+            content["reviews"] = page_reviews
+            if offset is not None or limit is not None:
+                content["page"] = {"total": total, "offset": start, "limit": limit}
+
+        return _json_response(content)
 
     except HTTPException:
         raise
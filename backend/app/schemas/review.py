@@ -26,11 +26,20 @@ class ReviewSummary(BaseModel):
 class ReviewList(BaseModel):
     reviews: List[Review]
 
+class SentenceSentiment(BaseModel):
+    text: str
+    label: str
+    score: Optional[float] = None
+
 class ReviewSentiment(BaseModel):
-    review_text: str
-    sentiment: str
+    # optional so a `fields=` projection can drop them from the response
+    review_text: Optional[str] = None
+    sentiment: Optional[str] = None
     score: Optional[float] = None
     aspects: Optional[List[str]] = None  # new: list of matched aspects
+    # only present when sentence_level=true
+    aspect_sentiments: Optional[Dict[str, str]] = None
+    sentences: Optional[List[SentenceSentiment]] = None
 
 class Recommendation(BaseModel):
     decision: str  # BUY | AVOID | CONSIDER | INSUFFICIENT_DATA
@@ -40,8 +49,14 @@ class Recommendation(BaseModel):
     top_positive_aspects: Optional[List[str]] = None
     top_negative_aspects: Optional[List[str]] = None
 
+class ReviewPage(BaseModel):
+    total: int
+    offset: int
+    limit: Optional[int] = None  # None => all remaining reviews
+
 class ReviewResponse(BaseModel):
-    reviews: List[ReviewSentiment]
+    reviews: Optional[List[ReviewSentiment]] = None  # omitted when summary_only=true
     summary: ReviewSummary
     aspect_summary: Optional[Dict[str, Any]] = None
-    recommendation: Optional[Recommendation] = None  # new field
\ No newline at end of file
+    recommendation: Optional[Recommendation] = None  # new field
+    page: Optional[ReviewPage] = None
\ No newline at end of file
@@ -1,4 +1,5 @@
 from typing import List, Dict, Any
+import re
 
 # try to import transformers pipeline if available (optional)
 _sentiment_pipeline = None
@@ -17,68 +18,108 @@ def _get_pipeline():
             _sentiment_pipeline = None
     return _sentiment_pipeline
 
-def analyze_sentiment(reviews: List[str]) -> List[Dict[str, Any]]:
+# thresholds: tune as needed
+POS_THRESH = 0.60
+NEG_THRESH = 0.40
+
+# texts per forward pass; inputs are sorted by length so each batch is
+# padded only to its own longest member instead of the model max length
+BATCH_SIZE = 32
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+def _label(score: float) -> Dict[str, Any]:
+    """Three-way label from a positive probability in [0, 1]."""
+    if score >= POS_THRESH:
+        label = "POSITIVE"
+    elif score <= NEG_THRESH:
+        label = "NEGATIVE"
+    else:
+        label = "NEUTRAL"
+    return {"label": label, "score": float(score)}
+
+def _positive_prob(r: Dict[str, Any]) -> float:
+    """Convert a pipeline (label, confidence) output into a positive probability."""
+    label = str(r.get("label", "")).upper()
+    score = float(r.get("score", 0.5))
+    if label.startswith("POS"):
+        return score
+    if label.startswith("NEG"):
+        return 1.0 - score
+    return 0.5
+
+def _split_sentences(text: str) -> List[str]:
+    parts = [p.strip() for p in _SENTENCE_SPLIT.split(text or "")]
+    return [p for p in parts if p] or [text or ""]
+
+def _pipeline_scores(pipe, texts: List[str]) -> List[float]:
     """
-    Return list of dicts: {label: 'POSITIVE'|'NEGATIVE'|'NEUTRAL', score: float}
-    Use thresholds to reduce false-neutrals/false-positives.
+    Score texts in length-sorted batches (dynamic padding) and return the
+    positive probabilities in input order. Character length is used as the
+    sort key so texts are tokenized only once, inside the pipeline.
     """
-    if not reviews:
-        return []
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    raw_sorted = pipe([texts[i] for i in order], batch_size=BATCH_SIZE, truncation=True)
+    scores: List[float] = [0.5] * len(texts)
+    for pos, i in enumerate(order):
+        scores[i] = _positive_prob(raw_sorted[pos])
+    return scores
 
-    # thresholds: tune as needed
-    POS_THRESH = 0.60
-    NEG_THRESH = 0.40
+def _rule_score(text: str) -> float:
+    positive_words = {"good", "great", "excellent", "love", "best", "amazing", "perfect", "fantastic", "awesome"}
+    negative_words = {"bad", "poor", "awful", "worst", "disappointed", "died", "broken", "refund", "terrible", "stopworking", "stopped"}
+    t = (text or "").lower()
+    pos_hits = sum(1 for w in positive_words if w in t)
+    neg_hits = sum(1 for w in negative_words if w in t)
+    # score in [0,1] where >0.5 => positive bias
+    base = 0.5 + 0.15 * (pos_hits - neg_hits)
+    # clamp
+    return max(0.0, min(1.0, base))
 
+def _score(texts: List[str]) -> List[float]:
     pipe = _get_pipeline()
-    results: List[Dict[str, Any]] = []
-
     if pipe:
         try:
-            raw = pipe(reviews, truncation=True)
-            for r in raw:
-                label = str(r.get("label", "NEUTRAL")).upper()
-                score = float(r.get("score", 0.0))
-                # normalize to three-way using score thresholds
-                if label.startswith("POS"):
-                    if score >= POS_THRESH:
-                        final = "POSITIVE"
-                    elif score <= NEG_THRESH:
-                        final = "NEGATIVE"
-                    else:
-                        final = "NEUTRAL"
-                elif label.startswith("NEG"):
-                    if score >= POS_THRESH:
-                        final = "POSITIVE"
-                    elif score <= NEG_THRESH:
-                        final = "NEGATIVE"
-                    else:
-                        final = "NEUTRAL"
-                else:
-                    final = "NEUTRAL"
-                results.append({"label": final, "score": float(score)})
-            return results
+            return _pipeline_scores(pipe, texts)
         except Exception:
             pass
-
     # fallback rule-based
-    positive_words = {"good", "great", "excellent", "love", "best", "amazing", "perfect", "fantastic", "awesome"}
-    negative_words = {"bad", "poor", "awful", "worst", "disappointed", "died", "broken", "refund", "terrible", "stopworking", "stopped"}
+    return [_rule_score(t) for t in texts]
+
+def analyze_sentiment(reviews: List[str], chunk_sentences: bool = False) -> List[Dict[str, Any]]:
+    """
+    Return list of dicts: {label: 'POSITIVE'|'NEGATIVE'|'NEUTRAL', score: float}
+    where score is the positive probability in [0, 1] (model or rule-based).
+    Use thresholds to reduce false-neutrals/false-positives.
+
+    With chunk_sentences=True each review is split into sentences, all
+    sentences are scored together and the review score is the word-weighted
+    mean of its sentence scores; each dict then also carries
+    sentences: [{text, label, score}, ...].
+    """
+    if not reviews:
+        return []
+
+    if not chunk_sentences:
+        return [_label(p) for p in _score(reviews)]
 
-    for text in reviews:
-        t = (text or "").lower()
-        pos_hits = sum(1 for w in positive_words if w in t)
-        neg_hits = sum(1 for w in negative_words if w in t)
-        # score in [0,1] where >0.5 => positive bias
-        base = 0.5 + 0.15 * (pos_hits - neg_hits)
-        # clamp
-        score = max(0.0, min(1.0, base))
-        # apply thresholds
-        if score >= POS_THRESH:
-            label = "POSITIVE"
-        elif score <= NEG_THRESH:
-            label = "NEGATIVE"
-        else:
-            label = "NEUTRAL"
-        results.append({"label": label, "score": float(score)})
-
-    return results
\ No newline at end of file
+    sentences: List[str] = []
+    owners: List[int] = []
+    for i, text in enumerate(reviews):
+        for sent in _split_sentences(text):
+            sentences.append(sent)
+            owners.append(i)
+    scores = _score(sentences)
+
+    grouped: List[List[int]] = [[] for _ in reviews]
+    for j, owner in enumerate(owners):
+        grouped[owner].append(j)
+
+    results: List[Dict[str, Any]] = []
+    for idxs in grouped:
+        weights = [max(len(sentences[j].split()), 1) for j in idxs]
+        p = sum(scores[j] * w for j, w in zip(idxs, weights)) / sum(weights)
+        res = _label(p)
+        res["sentences"] = [{"text": sentences[j], **_label(scores[j])} for j in idxs]
+        results.append(res)
+    return results
@@ -0,0 +1,77 @@
+import pytest
+
+from app.services import analysis
+
+
+class StubTokenizer:
+    def __call__(self, texts, **kwargs):
+        # batching sorts on character length; texts must not be pre-tokenized
+        raise AssertionError("tokenizer should only run inside the pipeline")
+
+
+class StubPipeline:
+    """Labels texts containing 'bad' NEGATIVE/0.98, everything else POSITIVE/0.95."""
+
+    def __init__(self):
+        self.tokenizer = StubTokenizer()
+        self.calls = []
+
+    def __call__(self, texts, batch_size=None, truncation=False):
+        self.calls.append(list(texts))
+        return [
+            {"label": "NEGATIVE", "score": 0.98} if "bad" in t.lower() else {"label": "POSITIVE", "score": 0.95}
+            for t in texts
+        ]
+
+
+@pytest.fixture
+def stub_pipe(monkeypatch):
+    pipe = StubPipeline()
+    monkeypatch.setattr(analysis, "_get_pipeline", lambda: pipe)
+    return pipe
+
+
+def test_outputs_keep_input_order_after_length_sort(stub_pipe):
+    reviews = ["A long and really bad review text here.", "Great.", "Bad one.", "Loved it, works well."]
+    out = analysis.analyze_sentiment(reviews)
+
+    assert stub_pipe.calls[0] == sorted(reviews, key=len)
+    assert [r["label"] for r in out] == ["NEGATIVE", "POSITIVE", "NEGATIVE", "POSITIVE"]
+    # score is the positive probability
+    assert out[0]["score"] == pytest.approx(0.02)
+    assert out[1]["score"] == pytest.approx(0.95)
+
+
+def test_chunked_negative_review_aggregates_negative(stub_pipe):
+    out = analysis.analyze_sentiment(["This is bad. Really bad stuff here."], chunk_sentences=True)
+
+    assert out[0]["label"] == "NEGATIVE"
+    assert out[0]["score"] == pytest.approx(0.02)
+    assert [s["text"] for s in out[0]["sentences"]] == ["This is bad.", "Really bad stuff here."]
+    assert all(s["label"] == "NEGATIVE" for s in out[0]["sentences"])
+
+
+def test_chunked_mixed_reviews(stub_pipe):
+    reviews = [
+        "Great sound. Battery is bad. Build is bad.",
+        "Works perfectly!",
+    ]
+    out = analysis.analyze_sentiment(reviews, chunk_sentences=True)
+
+    # every sentence is scored in a single batched call
+    assert len(stub_pipe.calls) == 1
+    assert [s["label"] for s in out[0]["sentences"]] == ["POSITIVE", "NEGATIVE", "NEGATIVE"]
+    assert out[0]["label"] == "NEGATIVE"
+    assert out[1]["label"] == "POSITIVE"
+    assert out[1]["sentences"] == [{"text": "Works perfectly!", "label": "POSITIVE", "score": 0.95}]
+
+
+def test_rule_based_fallback_chunks(monkeypatch):
+    monkeypatch.setattr(analysis, "_get_pipeline", lambda: None)
+    out = analysis.analyze_sentiment(
+        ["Great sound. But the battery died after a week and I want a refund!"], chunk_sentences=True
+    )
+
+    assert [s["label"] for s in out[0]["sentences"]] == ["POSITIVE", "NEGATIVE"]
+    assert out[0]["label"] == "NEGATIVE"
+    assert 0.0 <= out[0]["score"] <= 1.0
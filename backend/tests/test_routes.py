@@ -0,0 +1,93 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1 import routes
+from app.main import app
+
+N_REVIEWS = 5000
+
+
+@pytest.fixture
+def client(monkeypatch):
+    texts = [
+        f"Review {i}: the battery life is great and I love the sound quality."
+        if i % 2 == 0 else
+        f"Review {i}: the charging stopped working and I want a refund, poor build."
+        for i in range(N_REVIEWS)
+    ]
+    monkeypatch.setattr(routes.scraper, "scrape_reviews", lambda url: texts)
+
+    def fake_analyze(reviews, **kwargs):
+        return [
+            {"label": "POSITIVE", "score": 0.9} if "great" in r else {"label": "NEGATIVE", "score": 0.1}
+            for r in reviews
+        ]
+
+    monkeypatch.setattr(routes.analysis, "analyze_sentiment", fake_analyze)
+    return TestClient(app)
+
+
+def post(client, **params):
+    return client.post("/api/v1/reviews/", json={"url": "https://www.amazon.in/dp/X"}, params=params)
+
+
+def test_default_response_returns_all_reviews(client):
+    resp = post(client)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert len(body["reviews"]) == N_REVIEWS
+    assert set(body["reviews"][0]) == {"review_text", "sentiment", "score", "aspects"}
+    assert "page" not in body
+    assert body["summary"]["total_reviews"] == N_REVIEWS
+
+
+def test_summary_only(client):
+    body = post(client, summary_only="true").json()
+    assert "reviews" not in body
+    assert body["summary"]["positive_reviews"] == N_REVIEWS // 2
+    assert body["recommendation"]["decision"] == "AVOID"
+
+
+def test_offset_and_limit(client):
+    body = post(client, offset=10, limit=25).json()
+    assert len(body["reviews"]) == 25
+    assert body["reviews"][0]["review_text"].startswith("Review 10:")
+    assert body["page"] == {"total": N_REVIEWS, "offset": 10, "limit": 25}
+
+
+def test_fields_projection_omits_missing_keys(client):
+    body = post(client, fields="sentiment,score,sentences").json()
+    assert body["reviews"][0] == {"sentiment": "POSITIVE", "score": 0.9}
+
+
+def test_unknown_field_rejected(client):
+    resp = post(client, fields="sentiment,bogus")
+    assert resp.status_code == 400
+    assert "bogus" in resp.json()["detail"]
+
+
+def test_gzip_when_accepted(client):
+    resp = client.post(
+        "/api/v1/reviews/",
+        json={"url": "https://www.amazon.in/dp/X"},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert resp.headers.get("content-encoding") == "gzip"
+
+
+def test_sentence_level_aspect_sentiments(monkeypatch):
+    text = "The sound is great and I love it. The battery died after a week, refund please."
+    monkeypatch.setattr(routes.scraper, "scrape_reviews", lambda url: [text])
+    monkeypatch.setattr(routes.analysis, "_get_pipeline", lambda: None)
+
+    body = post(TestClient(app), sentence_level="true").json()
+    review = body["reviews"][0]
+    assert len(review["sentences"]) == 2
+    assert review["aspect_sentiments"] == {"battery": "NEGATIVE", "sound": "POSITIVE"}
+    assert body["aspect_summary"]["sound"]["positive"] == 1
+    assert body["aspect_summary"]["battery"]["negative"] == 1
+    # averages come from the sentences that mention each aspect
+    sound_score, battery_score = (s["score"] for s in review["sentences"])
+    assert body["aspect_summary"]["sound"]["average_score"] == pytest.approx(sound_score)
+    assert body["aspect_summary"]["battery"]["average_score"] == pytest.approx(battery_score)
+    assert sound_score > battery_score